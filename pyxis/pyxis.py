@@ -67,12 +67,14 @@ def post(url: str, body: Dict[str, Any]) -> requests.Response:
     if session is None:
         session = _get_session()
 
-    LOGGER.debug(f"POST request URL: {url}")
-    LOGGER.debug(f"POST request body: {body}")
+    LOGGER.debug("POST request URL: %s", url)
+    LOGGER.debug("POST request body: %s", body)
     resp = session.post(url, json=body)
 
     try:
-        LOGGER.debug(f"POST request response: {resp.text}")
+        # resp.text decodes the whole response body, so only touch it when it gets logged
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("POST request response: %s", resp.text)
         resp.raise_for_status()
     except requests.HTTPError:
         LOGGER.exception(
@@ -122,7 +124,7 @@ def put(url: str, body: Dict[str, Any]) -> Dict[str, Any]:
     if session is None:
         session = _get_session()
 
-    LOGGER.debug(f"PATCH Pyxis request: {url}")
+    LOGGER.debug("PATCH Pyxis request: %s", url)
     resp = session.put(url, json=body)
 
     try:
@@ -149,8 +151,8 @@ def get(url: str, params: Optional[Dict[str, str]] = None, auth_required: bool =
     if session is None:
         session = _get_session()
 
-    LOGGER.debug(f"GET Pyxis request url: {url}")
-    LOGGER.debug(f"GET Pyxis request params: {params}")
+    LOGGER.debug("GET Pyxis request url: %s", url)
+    LOGGER.debug("GET Pyxis request params: %s", params)
     resp = session.get(url, params=params)
     # Not raising exception for error statuses, because GET request can be used to check
     # if something exists. We don't want a 404 to cause failures.
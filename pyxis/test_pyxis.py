@@ -72,6 +72,18 @@ def test_post_error(mock_get_session: MagicMock) -> None:
         pyxis.post(API_URL, {})
 
 
+@patch("pyxis.LOGGER.isEnabledFor", return_value=False)
+@patch("pyxis.session")
+def test_post_response_not_read_without_debug(
+    mock_session: MagicMock, mock_is_enabled_for: MagicMock
+) -> None:
+    resp = MagicMock(spec=["raise_for_status"])
+    mock_session.post.return_value = resp
+
+    # resp has no `text` attribute, so reading it would raise AttributeError
+    assert pyxis.post(API_URL, REQUEST_BODY) == resp
+
+
 @patch("pyxis.post")
 def test_graphql_query__success(mock_post: MagicMock):
     mock_data = {
@@ -27,6 +27,9 @@ COMPONENTS = [
     {  # no upstream
         "purl": "pkg:rpm/rhel/pkg4@1-2.el8?arch=x86_64&distro=rhel-8.0",
     },
+    {  # no qualifiers
+        "purl": "pkg:rpm/rhel/pkg5@1-2.el8",
+    },
     {  # not an rpm
         "purl": "pkg:golang/./staging/src@(devel)#k8s.io/api",
     },
@@ -190,7 +193,7 @@ def test_create_image_rpm_manifest__error(mock_post):
 
 def test_construct_rpm_items__success():
     """Only rpm purls are added, the version, release,
-    and architecture fields are added if present"""
+    architecture and srpm_name fields are added if present"""
 
     rpms = construct_rpm_items(COMPONENTS)
 
@@ -210,6 +213,7 @@ def test_construct_rpm_items__success():
             "srpm_name": "pkg3-9-8.el8.src.rpm",
         },
         {"name": "pkg4", "version": "1", "release": "2.el8", "architecture": "x86_64"},
+        {"name": "pkg5", "version": "1", "release": "2.el8"},
     ]
 
 
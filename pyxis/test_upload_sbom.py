@@ -423,18 +423,16 @@ def test_create_content_manifest_component__no_components(
 
 @patch("upload_sbom.Template")
 @patch("builtins.open")
-@patch("upload_sbom.os")
-def test_get_template(mock_os, mock_open, mock_template):
-    template_path = mock_os.path.join.return_value
-
+@patch("upload_sbom.TEMPLATE_PATH", "mytemplatepath")
+def test_get_template(mock_open, mock_template):
     template = get_template()
 
-    mock_open.assert_called_with(template_path)
+    mock_open.assert_called_with("mytemplatepath")
     assert template == mock_template.return_value
     mock_open.return_value.__enter__.return_value.read.assert_called_once_with()
 
 
-@patch("json.load")
+@patch("upload_sbom.orjson.loads")
 @patch("upload_sbom.check_bom_ref_duplicates")
 @patch("builtins.open")
 def test_load_sbom_components__success(mock_open, mock_check_bom_ref_duplicates, mock_load):
@@ -443,12 +441,15 @@ def test_load_sbom_components__success(mock_open, mock_check_bom_ref_duplicates,
 
     loaded_components = load_sbom_components(SBOM_PATH)
 
-    mock_load.assert_called_once_with(mock_open.return_value.__enter__.return_value)
+    mock_open.assert_called_once_with(SBOM_PATH, "rb")
+    mock_load.assert_called_once_with(
+        mock_open.return_value.__enter__.return_value.read.return_value
+    )
     mock_check_bom_ref_duplicates.assert_called_once_with(loaded_components)
     assert fake_components == loaded_components
 
 
-@patch("json.load")
+@patch("upload_sbom.orjson.loads")
 @patch("upload_sbom.check_bom_ref_duplicates")
 @patch("builtins.open")
 def test_load_sbom_components__no_components_key(
@@ -458,12 +459,14 @@ def test_load_sbom_components__no_components_key(
 
     loaded_components = load_sbom_components(SBOM_PATH)
 
-    mock_load.assert_called_once_with(mock_open.return_value.__enter__.return_value)
+    mock_load.assert_called_once_with(
+        mock_open.return_value.__enter__.return_value.read.return_value
+    )
     mock_check_bom_ref_duplicates.assert_called_once_with(loaded_components)
     assert loaded_components == []
 
 
-@patch("json.load")
+@patch("upload_sbom.orjson.loads")
 @patch("upload_sbom.check_bom_ref_duplicates")
 @patch("builtins.open")
 def test_load_sbom_components__json_load_fails(
@@ -474,7 +477,9 @@ def test_load_sbom_components__json_load_fails(
     with pytest.raises(ValueError):
         load_sbom_components(SBOM_PATH)
 
-    mock_load.assert_called_once_with(mock_open.return_value.__enter__.return_value)
+    mock_load.assert_called_once_with(
+        mock_open.return_value.__enter__.return_value.read.return_value
+    )
     mock_check_bom_ref_duplicates.assert_not_called()
 
 
@@ -132,16 +132,18 @@ def construct_rpm_items(components: list[dict]) -> list[dict]:
     rpms_items = []
     for component in components:
         if "purl" in component:
-            purl_dict = PackageURL.from_string(component["purl"]).to_dict()
-            if purl_dict["type"] == "rpm":
-                rpm_item = {"name": purl_dict["name"]}
-                if purl_dict["version"] is not None:
-                    rpm_item["version"] = purl_dict["version"].split("-")[0]
-                    rpm_item["release"] = purl_dict["version"].split("-")[1]
-                if "arch" in purl_dict["qualifiers"]:
-                    rpm_item["architecture"] = purl_dict["qualifiers"]["arch"]
-                if "upstream" in purl_dict["qualifiers"]:
-                    rpm_item["srpm_name"] = purl_dict["qualifiers"]["upstream"]
+            purl = PackageURL.from_string(component["purl"])
+            if purl.type == "rpm":
+                rpm_item = {"name": purl.name}
+                if purl.version is not None:
+                    version_release = purl.version.split("-")
+                    rpm_item["version"] = version_release[0]
+                    rpm_item["release"] = version_release[1]
+                qualifiers = purl.qualifiers
+                if "arch" in qualifiers:
+                    rpm_item["architecture"] = qualifiers["arch"]
+                if "upstream" in qualifiers:
+                    rpm_item["srpm_name"] = qualifiers["upstream"]
                 rpms_items.append(rpm_item)
     return rpms_items
 
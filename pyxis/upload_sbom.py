@@ -21,12 +21,12 @@ import argparse
 import logging
 import string
 import os
-import json
 import re
 from pathlib import Path
 import time
 from typing import Any
 from jinja2 import Template
+import orjson
 
 import pyxis
 
@@ -41,6 +41,8 @@ UNSUPPORTED_FIELDS = [
     "components",
 ]
 TEMPLATE_FILE = "create_content_manifest_components.graphql.jinja"
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "../templates/", TEMPLATE_FILE)
+UPPERCASE_PATTERN = re.compile("([A-Z]+)")
 
 
 def parse_arguments() -> argparse.Namespace:  # pragma: no cover
@@ -135,12 +137,13 @@ def upload_sbom(graphql_api: str, image_id: str, sbom_path: str):
         # a given sbom. In most cases it is defined.
         # Pyxis team suggested we at least check this,
         # since Pyxis has no checks for component uniqueness.
-        if component.get("bom_ref") is not None:
-            if component["bom_ref"] in existing_bom_refs:
+        bom_ref = component.get("bom_ref")
+        if bom_ref is not None:
+            if bom_ref in existing_bom_refs:
                 LOGGER.info("Skipping component - bom_ref already exists in Pyxis")
                 continue
             else:
-                existing_bom_refs.add(component["bom_ref"])
+                existing_bom_refs.add(bom_ref)
 
         components.append(component)
 
@@ -229,8 +232,7 @@ mutation ($input: ContentManifestInput! ) {
 
 
 def get_existing_bom_refs(components: list) -> set[str]:
-    bom_refs = [c["bom_ref"] for c in components if c.get("bom_ref") is not None]
-    return set(bom_refs)
+    return {c["bom_ref"] for c in components if c.get("bom_ref") is not None}
 
 
 def create_content_manifest_components(
@@ -259,9 +261,7 @@ def create_content_manifest_components(
 
 
 def get_template() -> Template:
-    script_dir = os.path.dirname(__file__)
-    template_path = os.path.join(script_dir, "../templates/", TEMPLATE_FILE)
-    with open(template_path) as t:
+    with open(TEMPLATE_PATH) as t:
         template = Template(t.read())
     return template
 
@@ -274,8 +274,8 @@ def load_sbom_components(sbom_path: str) -> list[dict]:
     raise an exception.
     """
     try:
-        with open(sbom_path) as f:
-            sbom = json.load(f)
+        with open(sbom_path, "rb") as f:
+            sbom = orjson.loads(f.read())
         components = sbom["components"] if "components" in sbom else []
     except Exception:
         LOGGER.error("Unable to load components from sbom file")
@@ -320,7 +320,7 @@ def convert_keys(item: Any) -> Any:
         d = {}
         for k, v in item.items():
             k = k.replace("-", "_")
-            k = re.sub("([A-Z]+)", r"_\1", k).lower()
+            k = UPPERCASE_PATTERN.sub(r"_\1", k).lower()
             d[k] = convert_keys(v)
         return d
     else:
@@ -1,5 +1,6 @@
+import argparse
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, mock_open, MagicMock
 from apply_template import setup_argparser, main
 
 
@@ -24,21 +25,19 @@ def test_setup_argparser_improper_args():
 @patch("apply_template.Template.render")
 @patch("apply_template.setup_argparser")
 def test_apply_template_advisory_template(
-    mock_argparser: MagicMock, mock_render: MagicMock, mock_open: MagicMock
+    mock_argparser: MagicMock, mock_render: MagicMock, mock_file: MagicMock
 ):
-    args = MagicMock()
-    args.template = "templates/advisory.yaml.jinja"
-    args.data = "{}"
-    args.output = "somefile"
-    mock_argparser.return_value = args
+    mock_argparser.return_value = argparse.Namespace(
+        template="templates/advisory.yaml.jinja", data="{}", output="somefile"
+    )
     mock_render.return_value = "applied template file"
-    mock_open1 = MagicMock()
-    mock_open2 = MagicMock()
-    mock_open.side_effect = [mock_open1, mock_open2]
-    mock_open1.__enter__.return_value.read.return_value = "foo: bar"
-    file = mock_open2.__enter__.return_value
+    template_file = mock_open(read_data="foo: bar").return_value
+    output_file = mock_open().return_value
+    mock_file.side_effect = [template_file, output_file]
 
     # Act
     main()
 
-    file.write.assert_called_once_with("applied template file")
+    mock_file.assert_any_call("templates/advisory.yaml.jinja")
+    mock_file.assert_any_call("somefile", mode="w", encoding="utf-8")
+    output_file.write.assert_called_once_with("applied template file")